@@ -49,13 +49,24 @@ int emulate8080 (int cycles)
 		printf("[%04x] %s\n", e8080.PC, lut_mnemonic[opcode]);
 #endif
 
-		opTbl[opcode].execute (opcode);
 		cyclesDone += opTbl[opcode].cycles;
+		opTbl[opcode].execute (opcode);
 	}
 
 	return cyclesDone;
 }
 
+/*
+ * Host pointer to the byte at offset, or NULL if it isn't mapped. The
+ * bytes that follow it are valid up to the end of the bank holding it.
+*/
+u8 *memoryPtr (u16 offset)
+{
+	u8 *page = readPage[offset >> 8];
+
+	return page ? page + (offset & 0xFF) : NULL;
+}
+
 void reset8080 ()
 {
 	int c;
@@ -67,11 +78,14 @@ void reset8080 ()
 			continue;
 		if (e8080.ram[c].flag == FLAG_MIRROR)
 			continue;
-		if (!e8080.ram[c].ptr)
-			e8080.ram[c].ptr = malloc(e8080.ram[c].size);
-		if (!e8080.ram[c].flag != FLAG_ROM)
+		if (!e8080.ram[c].ptr) {
+			e8080.ram[c].ptr = calloc(1, e8080.ram[c].size);
+			continue;
+		}
+		if (e8080.ram[c].flag != FLAG_ROM)
 			memset(e8080.ram[c].ptr, 0, e8080.ram[c].size);
 	}
+	mapPages();
 }
 
 int initalize8080 ()
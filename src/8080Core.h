@@ -86,5 +86,6 @@ int emulate8080 (int cycles);
 void causeInt (int address);
 u8 readByte (u16 offset);
 void writeByte (u8 value, u16 offset);
+u8 *memoryPtr (u16 offset);
 
 #endif
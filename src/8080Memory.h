@@ -3,62 +3,72 @@
 
 #include "8080Core.h"
 
-#define WHITIN(x,y,z) ((x >= y) && (x <= z))
-
-inline void writeByte (u8 value, u16 offset)
+/*
+ * Page tables, one host pointer per 256 byte page of the address space.
+ * They are rebuilt from the bank list on every reset so a memory access
+ * is a single lookup instead of a scan over all the banks. Banks are
+ * expected to start on a page boundary.
+*/
+static u8 *readPage[0x100];
+static u8 *writePage[0x100];
+
+static void mapPages ()
 {
-	int c;
-
-	for (c = 0; c < 4; c++) {
-		if (!WHITIN(offset, e8080.ram[c].start, e8080.ram[c].start + e8080.ram[c].size))
-			continue;
-		if (e8080.ram[c].flag == FLAG_MIRROR) {
-			offset -= e8080.ram[c].start;
-			offset += e8080.ram[c].mirror;
+	int c, page;
+	u32 addr;
+
+	memset(readPage, 0, sizeof readPage);
+	memset(writePage, 0, sizeof writePage);
+
+	for (page = 0; page < 0x100; page++) {
+		addr = page << 8;
+
+		for (c = 0; c < 4; c++) {
+			if (e8080.ram[c].flag != FLAG_MIRROR)
+				continue;
+			if (addr < e8080.ram[c].start || addr >= e8080.ram[c].start + e8080.ram[c].size)
+				continue;
+			addr = addr - e8080.ram[c].start + e8080.ram[c].mirror;
+			break;
+		}
+
+		for (c = 0; c < 4; c++) {
+			if (e8080.ram[c].flag == FLAG_UNUSED || e8080.ram[c].flag == FLAG_MIRROR)
+				continue;
+			if (addr < e8080.ram[c].start || addr >= e8080.ram[c].start + e8080.ram[c].size)
+				continue;
+			readPage[page] = e8080.ram[c].ptr + (addr - e8080.ram[c].start);
+			if (e8080.ram[c].flag != FLAG_ROM)
+				writePage[page] = readPage[page];
 			break;
 		}
 	}
+}
 
-	for (c = 0; c < 8; c++) {
-		if (e8080.ram[c].flag == FLAG_UNUSED)
-			continue;
-		if (!WHITIN(offset, e8080.ram[c].start, e8080.ram[c].start + e8080.ram[c].size))
-			continue;
-		if (e8080.ram[c].flag == FLAG_ROM)
+inline void writeByte (u8 value, u16 offset)
+{
+	u8 *page = writePage[offset >> 8];
+
+	if (!page) {
+		if (readPage[offset >> 8])
 			die("Write to ROM region");
+		die("Write out of bounds!");
+	}
 #ifdef DEBUG
-		printf("Write %#x @ %#x\n", value, offset);
+	printf("Write %#x @ %#x\n", value, offset);
 #endif
-		e8080.ram[c].ptr[offset - e8080.ram[c].start] = value;
-		return;
-	}
-
-	die("Write out of bounds!");
+	page[offset & 0xFF] = value;
 }
 
 inline u8 readByte (u16 offset)
 {
-	int c;
-
-	for (c = 0; c < 4; c++) {
-		if (!WHITIN(offset, e8080.ram[c].start, e8080.ram[c].start + e8080.ram[c].size))
-			continue;
-		if (e8080.ram[c].flag == FLAG_MIRROR) {
-			offset -= e8080.ram[c].start;
-			offset += e8080.ram[c].mirror;
-			break;
-		}
-	}
+	u8 *page = readPage[offset >> 8];
 
-	for (c = 0; c < 4; c++) {
-		if (e8080.ram[c].flag == FLAG_UNUSED)
-			continue;
-		if (!WHITIN(offset, e8080.ram[c].start, e8080.ram[c].start + e8080.ram[c].size))
-			continue;
+	if (page) {
 #ifdef DEBUG
-		printf("Read @ %#x\n", value, offset);
+		printf("Read @ %#x\n", offset);
 #endif
-		return e8080.ram[c].ptr[offset - e8080.ram[c].start];
+		return page[offset & 0xFF];
 	}
 
 	die("Read out of bounds!");
@@ -1,4 +1,5 @@
 #include <stdio.h>
+#include <string.h>
 #include "8080Core.h"
 #include <SDL/SDL.h>
 
@@ -67,19 +68,50 @@ void spaceInvaders_portOut (int port, u8 value)
 	}
 }
 
+/* The 8 surface pixels each possible VRAM byte expands to, LSB first */
+static u8 pixelTbl[0x100][8];
+
+void spaceInvaders_build_pixel_table ()
+{
+	int v, b;
+
+	for (v = 0; v < 0x100; v++) {
+		for (b=0;b<8;b++) {
+			pixelTbl[v][b] = ((v >> b)&1) ? 0xFF : 0x00;
+		}
+	}
+}
+
+/* VRAM as of the last drawn frame, used to skip redrawing identical frames */
+static u8 lastVram[0x4000 - 0x2400];
+static int lastVramValid = 0;
+
 void spaceInvaders_vblank ()
 {	
-	int vramPtr, b;
+	int vramPtr;
+	u8 *vram;
+
+	/* Nothing to show while the window is iconified */
+	if (!(SDL_GetAppState() & SDL_APPACTIVE)) {
+		lastVramValid = 0;
+		return;
+	}
+
+	vram = memoryPtr(0x2400);
+
+	if (lastVramValid && !memcmp(vram, lastVram, sizeof lastVram))
+		return;
+
+	memcpy(lastVram, vram, sizeof lastVram);
+	lastVramValid = 1;
 
 	SDL_LockSurface(screen);
 	
 	u8 *screenPtr = screen->pixels;
 
 	for (vramPtr = 0; vramPtr < 0x4000 - 0x2400; vramPtr++) { 
-		for (b=0;b<8;b++) {
-			*screenPtr = ((readByte(0x2400 + vramPtr) >> b)&1) ? 0xFF : 0x00; 
-			screenPtr++;
-		}
+		memcpy(screenPtr, pixelTbl[lastVram[vramPtr]], 8);
+		screenPtr += 8;
 	}
 	
 	SDL_UnlockSurface(screen);
@@ -87,25 +119,22 @@ void spaceInvaders_vblank ()
 	SDL_Flip(screen);
 }
 
+/* Port 1 bit raised by each key, unmapped keys are 0 */
+static const u8 keyMap[SDLK_LAST] =
+{
+	[SDLK_LEFT]  = (1 << 5),
+	[SDLK_RIGHT] = (1 << 6),
+	[SDLK_c]     = (1 << 0),
+	[SDLK_x]     = (1 << 2),
+	[SDLK_z]     = (1 << 4),
+};
+
 void spaceInvaders_update_input ()
 {
 	while (SDL_PollEvent(&ev)) {
 		switch (ev.type) {
 			case SDL_KEYDOWN:
-				switch(ev.key.keysym.sym) {
-					case SDLK_LEFT:
-						dip1 |= (1 << 5); break;
-					case SDLK_RIGHT:
-						dip1 |= (1 << 6); break;
-					case SDLK_c:
-						dip1 |= (1 << 0); break;
-					case SDLK_x:
-						dip1 |= (1 << 2); break;
-					case SDLK_z:
-						dip1 |= (1 << 4); break;						
-					default:
-						break;
-				} break;
+				dip1 |= keyMap[ev.key.keysym.sym]; break;
 			case SDL_QUIT:
 				exit(0);
 				break;
@@ -130,6 +159,8 @@ int main(int argc, char *argv[])
 	
 	SDL_WM_SetCaption("OMGALIENZATEMYLEM0N", NULL);
 
+	spaceInvaders_build_pixel_table();
+
 	if (!initalize8080()) {
 		printf("Error while initializing the processor\n");
 		exit(0);